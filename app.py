@@ -1,19 +1,73 @@
-from flask import Flask, jsonify, request, send_file
+from flask import Flask, Response, jsonify, request, send_file
+from flask.json.provider import JSONProvider
+import hashlib
 import json
 import io
+import tempfile
+import math
+import time
+import numpy as np
+from jinja2 import BaseLoader, Environment
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from reportlab.pdfgen import canvas
 from reportlab.platypus import Table, TableStyle
 
+try:
+    import orjson
+except ImportError:
+    # Optional - Flask's default JSON provider is the fallback
+    orjson = None
+
+try:
+    from flask_compress import Compress
+except ImportError:
+    # Optional - responses go out uncompressed without it
+    Compress = None
+
 app = Flask(__name__)
 
+class ORJSONProvider(JSONProvider):
+    """JSON provider backed by orjson - C-speed serialization that also
+    understands NumPy scalars/arrays directly"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+if orjson is not None:
+    app.json = ORJSONProvider(app)
+
+# Compress the big inline-script HTML page and the JSON plan payloads on
+# the wire; brotli preferred, gzip fallback
+if Compress is not None:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIMETYPES'] = ['text/html', 'application/json',
+                                       'application/javascript']
+    Compress(app)
+
 # In-memory storage
 cargo_requests = []
 request_counter = 0
 latest_load_plan = None  # Store the latest generated plan for ground crew view
 
+# Memoized optimizer results keyed on (aircraft envelope, request buckets).
+# The solver is deterministic, so a repeat click with unchanged inputs can
+# return the previous plan instead of re-running the packing search.
+_optimize_cache = {}
+_OPTIMIZE_CACHE_MAX = 64
+
+# Snapshot of the most recent cold solve for warm-starting: when the user
+# only adds requests between clicks, the previous placements stay valid
+# and only the new units need a position search.
+_last_solve_state = None
+
 # Item type presets with dimensions in meters and weight in kg
 ITEM_PRESETS = {
     "Water Case (24 bottles)": {
@@ -54,6 +108,16 @@ ITEM_PRESETS = {
     }
 }
 
+# Flat lookup tables derived from ITEM_PRESETS: an integer id per type and
+# a tuple table of (weight, length, width, height) so hot loops do one
+# index instead of two string-keyed dict probes
+ITEM_TYPES = list(ITEM_PRESETS)
+ITEM_ID = {name: i for i, name in enumerate(ITEM_TYPES)}
+PRESET_TABLE = tuple(
+    (p['weight'], p['length'], p['width'], p['height'])
+    for p in ITEM_PRESETS.values()
+)
+
 # Aircraft presets with fuel consumption data
 AIRCRAFT_PRESETS = {
     "UH-60 Black Hawk": {
@@ -73,15 +137,21 @@ AIRCRAFT_PRESETS = {
 def calculate_fuel_efficiency(aircraft_type, cargo_weight, mission_distance=100):
     """
     Calculate fuel efficiency metrics for a given cargo load
-    
+
     Args:
         aircraft_type: Aircraft model name
         cargo_weight: Total weight of cargo in kg
         mission_distance: Round-trip distance in km (default 100km)
-    
+
     Returns:
         Dictionary with fuel efficiency metrics
     """
+    # Item weights are whole kg, so rounding makes repeat solves cache hits
+    return _fuel_metrics(aircraft_type, round(cargo_weight), mission_distance)
+
+@lru_cache(maxsize=256)
+def _fuel_metrics(aircraft_type, cargo_weight, mission_distance):
+    """Memoized core of calculate_fuel_efficiency (weight pre-rounded)"""
     aircraft = AIRCRAFT_PRESETS.get(aircraft_type)
     if not aircraft:
         return None
@@ -149,7 +219,14 @@ def get_quantity_from_priority(priority):
 
 @app.route('/')
 def index():
-    return HTML_TEMPLATE
+    # Static page: serve with a precomputed ETag so repeat visits
+    # short-circuit to 304 instead of re-sending the full template
+    if _INDEX_ETAG in request.if_none_match:
+        return '', 304
+    resp = Response(HTML_TEMPLATE, mimetype='text/html')
+    resp.set_etag(_INDEX_ETAG)
+    resp.headers['Cache-Control'] = 'public, max-age=3600'
+    return resp
 
 @app.route('/api/requests', methods=['GET', 'POST'])
 def handle_requests():
@@ -163,22 +240,30 @@ def handle_requests():
         # Calculate quantity from priority
         quantity = get_quantity_from_priority(priority)
         
-        if item_type not in ITEM_PRESETS:
+        type_id = ITEM_ID.get(item_type)
+        if type_id is None:
             return jsonify({"error": "Invalid item type"}), 400
-        
-        item_specs = ITEM_PRESETS[item_type]
-        
-        for _ in range(quantity):
-            request_counter += 1
+
+        weight, length, width, height = PRESET_TABLE[type_id]
+
+        # Requests are stored as (item_type, priority, count) buckets -
+        # units of the same type are interchangeable for packing, so there's
+        # no need for one dict per unit
+        for bucket in cargo_requests:
+            if bucket['item_type'] == item_type and bucket['priority'] == priority:
+                bucket['count'] += quantity
+                break
+        else:
             cargo_requests.append({
-                "id": request_counter,
                 "item_type": item_type,
                 "priority": priority,
-                "weight": item_specs["weight"],
-                "length": item_specs["length"],
-                "width": item_specs["width"],
-                "height": item_specs["height"]
+                "count": quantity,
+                "weight": weight,
+                "length": length,
+                "width": width,
+                "height": height
             })
+        request_counter += quantity
         
         return jsonify({"success": True, "message": f"Added {quantity} {item_type}(s) (Priority {priority})"})
     
@@ -193,150 +278,207 @@ def clear_requests():
 
 @app.route('/api/optimize', methods=['POST'])
 def optimize_cargo():
-    global latest_load_plan
+    global latest_load_plan, _last_solve_state
     
     data = request.json
     max_weight = float(data.get('max_weight', 10000))
     max_length = float(data.get('max_length', 10))
     max_width = float(data.get('max_width', 3))
     max_height = float(data.get('max_height', 2.5))
-    
+    fast = bool(data.get('fast', False))
+
+    # Same envelope and same request buckets means the same plan - serve
+    # it from the memo instead of re-solving
+    cache_key = (
+        (max_weight, max_length, max_width, max_height, fast),
+        tuple(sorted((b['item_type'], b['priority'], b['count']) for b in cargo_requests))
+    )
+    cached = _optimize_cache.get(cache_key)
+    if cached is not None:
+        latest_load_plan = cached
+        return jsonify(cached)
+
     # Calculate optimal weight range for fuel efficiency (75-85% of max capacity)
     optimal_min_weight = max_weight * 0.75
     optimal_max_weight = max_weight * 0.85
     
-    # Sort by priority (descending) then by weight (descending for better balancing)
-    sorted_requests = sorted(
-        cargo_requests,
-        key=lambda x: (-x['priority'], -x['weight']),
-        reverse=False
-    )
-    
     packed = []
+    packed_arrays = PackedArrays()
     unpacked = []
     current_weight = 0
     current_volume = 0
     max_volume = max_length * max_width * max_height
     
+    # Voxel occupancy grid: one cell per GRID_STEP of the cargo bay.
+    # Collision checks become a slab lookup instead of scanning every packed item.
+    occupancy = make_occupancy_grid(max_length, max_width, max_height)
+
+    # Heightmap of the tallest occupied point per xy cell - lets searches
+    # skip collision probes above the current stack
+    top_z = np.zeros(occupancy.shape[:2])
+
+    # Candidate placement corners for the Extreme-Point heuristic,
+    # seeded with the bay origin
+    extreme_points = [(0.0, 0.0, 0.0)]
+
     # Track positions for balanced loading
     # Divide cargo bay into quadrants for weight distribution
     front_left_weight = 0
     front_right_weight = 0
     rear_left_weight = 0
     rear_right_weight = 0
-    
-    # Group items by priority for preemptive packing
-    priority_groups = {}
-    for item in sorted_requests:
-        priority = item['priority']
-        if priority not in priority_groups:
-            priority_groups[priority] = []
-        priority_groups[priority].append(item)
-    
-    # Pack items with priority-based weighting
-    # Higher priorities get more attempts to pack before lower priorities
-    # Priority 10 gets fully processed, then 9, then 8, etc.
-    # But we allow some overlap - lower priorities start getting a chance
-    # as we progress through higher priority items
-    
+
+    # Buckets are unique per (type, priority) - handle_requests merges them
+    req_counts = {(b['item_type'], b['priority']): b['count'] for b in cargo_requests}
+
+    # Warm start: same envelope and a request multiset that only grew means
+    # every previous placement is still valid. Replay them onto the fresh
+    # grid and search positions only for the added units.
+    prev = _last_solve_state
+    delta_counts = None
+    if (prev is not None
+            and prev['envelope'] == (max_weight, max_length, max_width, max_height, fast)
+            and all(req_counts.get(k, 0) >= v for k, v in prev['counts'].items())):
+        delta_counts = {k: c - prev['counts'].get(k, 0) for k, c in req_counts.items()}
+
+    unit_id = 0
+    if delta_counts is not None:
+        for item in prev['packed']:
+            item = dict(item)
+            position = item['position']
+            weight = item['weight']
+            packed.append(item)
+            packed_arrays.append(weight, position)
+            mark_occupied(occupancy, top_z, position, item['length'], item['width'], item['height'])
+            update_extreme_points(extreme_points, position, item['length'], item['width'], item['height'])
+            current_weight += weight
+            current_volume += item['length'] * item['width'] * item['height']
+
+            in_front = position['x'] < max_length / 2
+            on_left = position['y'] < max_width / 2
+            if in_front and on_left:
+                front_left_weight += weight
+            elif in_front and not on_left:
+                front_right_weight += weight
+            elif not in_front and on_left:
+                rear_left_weight += weight
+            else:
+                rear_right_weight += weight
+
+        # Previously unplaceable items can't fit any better now - the bay
+        # only got fuller
+        unpacked.extend(dict(item) for item in prev['unpacked'])
+        unit_id = prev['next_id']
+
+        source_buckets = [
+            {**b, 'count': delta_counts[(b['item_type'], b['priority'])]}
+            for b in cargo_requests
+            if delta_counts.get((b['item_type'], b['priority']), 0) > 0
+        ]
+    else:
+        source_buckets = cargo_requests
+
+    # Group request buckets by priority in a single pass - no intermediate
+    # sorted copy of the full request list
+    priority_groups = defaultdict(list)
+    for bucket in source_buckets:
+        priority_groups[bucket['priority']].append(bucket)
+
+    # The top-off section must see every request bucket even on a warm
+    # start (where priority_groups holds only the delta) - otherwise a
+    # warm solve tops off differently from the cold solve that shares its
+    # cache slot
+    if source_buckets is cargo_requests:
+        topoff_groups = priority_groups
+    else:
+        topoff_groups = defaultdict(list)
+        for bucket in cargo_requests:
+            topoff_groups[bucket['priority']].append(bucket)
+
+    # Explode buckets into per-unit items only here, priority descending
+    # and heavier types first within each priority (same ordering the old
+    # full-list sort produced). Unit ids are assigned per solve.
     items_by_priority = []
-    for priority in sorted(priority_groups.keys(), reverse=True):
-        items_by_priority.extend([(item, priority) for item in priority_groups[priority]])
-    
-    # Calculate how many items to attempt from each priority level
-    # Higher priorities get processed more aggressively
-    total_items = len(items_by_priority)
-    packed_items_set = set()
-    
-    # Track if we've hit optimal fuel efficiency range
-    in_optimal_range = False
-    
-    # Multi-pass packing: each pass focuses on progressively lower priorities
-    for pass_num in range(10):
-        min_priority_for_pass = 10 - pass_num
-        
-        for idx, (item, priority) in enumerate(items_by_priority):
-            # Skip if already packed
-            if idx in packed_items_set:
-                continue
-            
-            # In early passes, only pack high priority items
-            # In later passes, allow lower priority items
-            if priority < min_priority_for_pass:
-                continue
-            
-            # Check if we're in optimal fuel efficiency range
-            if current_weight >= optimal_min_weight and current_weight <= optimal_max_weight:
-                in_optimal_range = True
-                # Once in optimal range, only pack items if they keep us in range
-                # and only if they're high priority (7+)
-                if current_weight + item['weight'] > optimal_max_weight:
-                    # Would exceed optimal range
-                    if priority < 8:  # Only priority 8+ can push past optimal
-                        continue
-            
-            # Try to pack this item
-            item_volume = item['length'] * item['width'] * item['height']
-            
-            # Check if item fits within constraints
-            if (current_weight + item['weight'] <= max_weight and
-                current_volume + item_volume <= max_volume and
-                item['length'] <= max_length and
-                item['width'] <= max_width and
-                item['height'] <= max_height):
-                
-                # Find available position with weight balancing
-                best_position = find_balanced_position(
-                    packed, item, max_length, max_width, max_height, 
-                    front_left_weight, front_right_weight, 
-                    rear_left_weight, rear_right_weight
-                )
-                
-                if best_position:
-                    item_with_pos = item.copy()
-                    item_with_pos['position'] = best_position
-                    packed.append(item_with_pos)
-                    current_weight += item['weight']
-                    current_volume += item_volume
-                    packed_items_set.add(idx)
-                    
-                    # Update quadrant weights
-                    in_front = best_position['x'] < max_length / 2
-                    on_left = best_position['y'] < max_width / 2
-                    
-                    if in_front and on_left:
-                        front_left_weight += item['weight']
-                    elif in_front and not on_left:
-                        front_right_weight += item['weight']
-                    elif not in_front and on_left:
-                        rear_left_weight += item['weight']
-                    else:
-                        rear_right_weight += item['weight']
-        
-        # If we're in optimal range and have processed high priorities, we can stop
-        if in_optimal_range and pass_num >= 3:  # After processing priorities 10, 9, 8, 7
-            # Check if there are any critical (priority 9-10) items left
-            critical_items_remaining = any(
-                idx not in packed_items_set and priority >= 9
-                for idx, (item, priority) in enumerate(items_by_priority)
+    for priority in sorted(priority_groups, reverse=True):
+        for bucket in sorted(priority_groups[priority], key=lambda b: -b['weight']):
+            for _ in range(bucket['count']):
+                unit_id += 1
+                items_by_priority.append(({
+                    "id": unit_id,
+                    "item_type": bucket['item_type'],
+                    "priority": priority,
+                    "weight": bucket['weight'],
+                    "length": bucket['length'],
+                    "width": bucket['width'],
+                    "height": bucket['height']
+                }, priority))
+
+    # Single descending-priority walk: items_by_priority is already sorted
+    # high-to-low, so one pass gives every higher-priority item its chance
+    # before any lower-priority one - same semantics as the old 10-pass
+    # re-scan without re-visiting skipped items
+    for item, priority in items_by_priority:
+        # Check if we're in optimal fuel efficiency range
+        if current_weight >= optimal_min_weight and current_weight <= optimal_max_weight:
+            # Once in optimal range, only pack items if they keep us in range
+            # and only if they're high priority (7+)
+            if current_weight + item['weight'] > optimal_max_weight:
+                # Would exceed optimal range
+                if priority < 8:  # Only priority 8+ can push past optimal
+                    unpacked.append(item)
+                    continue
+
+        # Try to pack this item
+        item_volume = item['length'] * item['width'] * item['height']
+
+        # Check if item fits within constraints
+        if (current_weight + item['weight'] <= max_weight and
+            current_volume + item_volume <= max_volume and
+            item['length'] <= max_length and
+            item['width'] <= max_width and
+            item['height'] <= max_height):
+
+            # Find available position with weight balancing
+            best_position = find_balanced_position(
+                occupancy, top_z, item, max_length, max_width, max_height,
+                front_left_weight, front_right_weight,
+                rear_left_weight, rear_right_weight,
+                extreme_points, coarse=fast
             )
-            if not critical_items_remaining:
-                break
-    
-    # Collect unpacked items
-    for idx, (item, priority) in enumerate(items_by_priority):
-        if idx not in packed_items_set:
-            unpacked.append(item)
+
+            if best_position:
+                packed.append(attach_position(item, best_position))
+                packed_arrays.append(item['weight'], best_position)
+                mark_occupied(occupancy, top_z, best_position, item['length'], item['width'], item['height'])
+                update_extreme_points(extreme_points, best_position, item['length'], item['width'], item['height'])
+                current_weight += item['weight']
+                current_volume += item_volume
+
+                # Update quadrant weights
+                in_front = best_position['x'] < max_length / 2
+                on_left = best_position['y'] < max_width / 2
+
+                if in_front and on_left:
+                    front_left_weight += item['weight']
+                elif in_front and not on_left:
+                    front_right_weight += item['weight']
+                elif not in_front and on_left:
+                    rear_left_weight += item['weight']
+                else:
+                    rear_right_weight += item['weight']
+                continue
+
+        unpacked.append(item)
     
     # Auto top-off: Fill to 75% minimum using priorities 8-10 with proportional distribution
     # If all three priorities exist: ~60% from p10, ~30% from p9, ~10% from p8
     # Rotate through item types to distribute evenly
     optimal_min_weight = max_weight * 0.75
-    has_high_priority = any(p >= 8 for p in priority_groups.keys())
+    has_high_priority = any(p >= 8 for p in topoff_groups.keys())
     
     if current_weight < optimal_min_weight and has_high_priority:
         # Get priorities 8, 9, 10 that user selected
-        high_priorities = sorted([p for p in priority_groups.keys() if p >= 8], reverse=True)
+        high_priorities = sorted([p for p in topoff_groups.keys() if p >= 8], reverse=True)
         
         if high_priorities:
             # Calculate how much weight we need to add
@@ -365,114 +507,152 @@ def optimize_cargo():
                 # Only one priority: 100%
                 priority_weights[high_priorities[0]] = weight_needed
             
-            # Track how much weight added per priority
-            weight_added_per_priority = {p: 0 for p in high_priorities}
-            
-            max_topoff_attempts = 1000
-            attempts = 0
-            
-            while current_weight < optimal_min_weight and attempts < max_topoff_attempts:
-                attempts += 1
-                added_something = False
-                
-                # Rotate through priorities proportionally, but allow overflow if needed to hit 75%
-                for priority in high_priorities:
-                    # Allow going over proportional weight if we haven't hit 75% yet
-                    # Only enforce proportional limits if we're past 75%
-                    if current_weight >= optimal_min_weight:
-                        break
-                    
-                    # Soft limit: prefer proportional distribution but don't stop if under 75%
-                    proportion_target = priority_weights.get(priority, weight_needed)
-                    
-                    items_at_priority = priority_groups[priority]
-                    if not items_at_priority:
+            # Unique item types per priority, computed once for both the
+            # quantity solve and the padding below
+            unique_types_by_priority = {
+                p: sorted({bucket['item_type'] for bucket in topoff_groups[p]})
+                for p in high_priorities
+            }
+
+            # Closed-form quantity solve: item weights are fixed, so the
+            # number of fill items each priority needs is known up front -
+            # no trial-and-error attempts loop, just one placement per item
+            fill_queue = []
+            for priority in high_priorities:
+                unique_types = unique_types_by_priority[priority]
+                if not unique_types:
+                    continue
+                type_weights = [PRESET_TABLE[ITEM_ID[t]][0] for t in unique_types]
+                avg_weight = sum(type_weights) / len(type_weights)
+                n_needed = math.ceil(priority_weights.get(priority, weight_needed) / avg_weight)
+                # Rotate through item types for even distribution
+                fill_queue.extend(
+                    (unique_types[i % len(unique_types)], priority) for i in range(n_needed)
+                )
+
+            # Ceil rounding per priority can undershoot the 75% floor and
+            # placements may fail on space - pad the queue from the highest
+            # priority so the loop can still reach the target
+            # Dict order follows high_priorities, so the first non-empty
+            # entry is the highest priority with types - one lookup per key
+            pad_types = next(
+                (types for types in unique_types_by_priority.values() if types),
+                None
+            )
+            if pad_types:
+                pad_priority = high_priorities[0]
+                min_weight = min(PRESET_TABLE[ITEM_ID[t]][0] for t in pad_types)
+                n_pad = math.ceil(weight_needed / min_weight)
+                fill_queue.extend(
+                    (pad_types[i % len(pad_types)], pad_priority) for i in range(n_pad)
+                )
+
+            # Hard cap (the old loop's max_topoff_attempts) so a huge
+            # weight_needed can't turn into an unbounded placement search
+            del fill_queue[1000:]
+
+            # The bay state only ever fills up, so a type that fails to
+            # place once can never place later - drop it from the rotation
+            # and stop as soon as every fill type has failed
+            fill_types_total = sum(len(t) for t in unique_types_by_priority.values())
+            failed_types = set()
+
+            # Fill ids start above any already in the plan (replayed
+            # warm-start fills included) - counting placed items could
+            # re-issue an id whenever a mid-queue placement had failed
+            next_fill_id = max(
+                (item['id'] for item in packed if item['id'] >= 10000),
+                default=9999
+            ) + 1
+
+            for item_type, priority in fill_queue:
+                if current_weight >= optimal_min_weight:
+                    break
+                if item_type in failed_types:
+                    continue
+
+                weight, length, width, height = PRESET_TABLE[ITEM_ID[item_type]]
+
+                new_item = {
+                    "id": next_fill_id,
+                    "item_type": item_type,
+                    "priority": priority,
+                    "weight": weight,
+                    "length": length,
+                    "width": width,
+                    "height": height
+                }
+
+                next_fill_id += 1
+                item_volume = length * width * height
+
+                # Check if item fits
+                if (current_weight + weight <= max_weight and
+                    current_volume + item_volume <= max_volume and
+                    length <= max_length and
+                    width <= max_width and
+                    height <= max_height):
+
+                    # Find position
+                    best_position = find_balanced_position(
+                        occupancy, top_z, new_item, max_length, max_width, max_height,
+                        front_left_weight, front_right_weight,
+                        rear_left_weight, rear_right_weight,
+                        extreme_points, coarse=fast
+                    )
+
+                    if best_position:
+                        packed.append(attach_position(new_item, best_position))
+                        packed_arrays.append(weight, best_position)
+                        mark_occupied(occupancy, top_z, best_position, length, width, height)
+                        update_extreme_points(extreme_points, best_position, length, width, height)
+                        current_weight += weight
+                        current_volume += item_volume
+
+                        # Update quadrant weights
+                        in_front = best_position['x'] < max_length / 2
+                        on_left = best_position['y'] < max_width / 2
+
+                        if in_front and on_left:
+                            front_left_weight += weight
+                        elif in_front and not on_left:
+                            front_right_weight += weight
+                        elif not in_front and on_left:
+                            rear_left_weight += weight
+                        else:
+                            rear_right_weight += weight
                         continue
-                    
-                    # Get all unique item types at this priority
-                    unique_types = list(set(item['item_type'] for item in items_at_priority))
-                    
-                    # Rotate through item types for even distribution
-                    item_type = unique_types[attempts % len(unique_types)]
-                    item_specs = ITEM_PRESETS[item_type]
-                    
-                    new_item = {
-                        "id": 10000 + attempts,
-                        "item_type": item_type,
-                        "priority": priority,
-                        "weight": item_specs["weight"],
-                        "length": item_specs["length"],
-                        "width": item_specs["width"],
-                        "height": item_specs["height"]
-                    }
-                    
-                    item_volume = new_item['length'] * new_item['width'] * new_item['height']
-                    
-                    # Check if item fits
-                    if (current_weight + new_item['weight'] <= max_weight and
-                        current_volume + item_volume <= max_volume and
-                        new_item['length'] <= max_length and
-                        new_item['width'] <= max_width and
-                        new_item['height'] <= max_height):
-                        
-                        # Find position
-                        best_position = find_balanced_position(
-                            packed, new_item, max_length, max_width, max_height,
-                            front_left_weight, front_right_weight,
-                            rear_left_weight, rear_right_weight
-                        )
-                        
-                        if best_position:
-                            item_with_pos = new_item.copy()
-                            item_with_pos['position'] = best_position
-                            packed.append(item_with_pos)
-                            current_weight += new_item['weight']
-                            current_volume += item_volume
-                            weight_added_per_priority[priority] += new_item['weight']
-                            added_something = True
-                            
-                            # Update quadrant weights
-                            in_front = best_position['x'] < max_length / 2
-                            on_left = best_position['y'] < max_width / 2
-                            
-                            if in_front and on_left:
-                                front_left_weight += new_item['weight']
-                            elif in_front and not on_left:
-                                front_right_weight += new_item['weight']
-                            elif not in_front and on_left:
-                                rear_left_weight += new_item['weight']
-                            else:
-                                rear_right_weight += new_item['weight']
-                            
-                            # Check if we've reached 75%
-                            if current_weight >= optimal_min_weight:
-                                break
-                    
-                    if current_weight >= optimal_min_weight:
-                        break
-                
-                # If we couldn't add anything, stop
-                if not added_something:
+
+                failed_types.add(item_type)
+                if len(failed_types) >= fill_types_total:
                     break
-            
-            # If still below 75% after all attempts, we've hit physical constraints
-            # (volume or space limitations)
+
+            # If still below 75% after draining the queue, we've hit physical
+            # constraints (volume or space limitations)
     
     # Recalculate final center of gravity and balance metrics
     if packed:
-        cog_x = sum(p['position']['x'] * p['weight'] for p in packed) / current_weight
-        cog_y = sum(p['position']['y'] * p['weight'] for p in packed) / current_weight
-        cog_z = sum(p['position']['z'] * p['weight'] for p in packed) / current_weight
+        n = packed_arrays.n
+        w = packed_arrays.weights[:n]
+        cog_x = np.dot(packed_arrays.px[:n], w) / current_weight
+        cog_y = np.dot(packed_arrays.py[:n], w) / current_weight
+        cog_z = np.dot(packed_arrays.pz[:n], w) / current_weight
         
         # Calculate balance percentage (how close to center in both X and Y)
         balance_x = 100 - (abs(cog_x - max_length/2) / (max_length/2) * 100)
         balance_y = 100 - (abs(cog_y - max_width/2) / (max_width/2) * 100)
         
         balance_score = (balance_x + balance_y) / 2
-        
+
+        # Recompute quadrant weights in one C-level pass: 2-bit quadrant
+        # index (rear bit, right bit) folded through np.bincount
+        quadrant_idx = ((packed_arrays.px[:n] >= max_length / 2).astype(int) * 2 +
+                        (packed_arrays.py[:n] >= max_width / 2))
+        quadrant_weights = np.bincount(quadrant_idx, weights=w, minlength=4)
+
         # Calculate left/right balance
-        left_weight = front_left_weight + rear_left_weight
-        right_weight = front_right_weight + rear_right_weight
+        left_weight = quadrant_weights[0] + quadrant_weights[2]
+        right_weight = quadrant_weights[1] + quadrant_weights[3]
     else:
         cog_x = cog_y = cog_z = 0
         balance_score = 100
@@ -485,8 +665,43 @@ def optimize_cargo():
     # Calculate fuel efficiency for this load
     fuel_metrics = calculate_fuel_efficiency("UH-60 Black Hawk", current_weight)
     
+    # Grouped counts for the client's requests table - aggregating here is
+    # one pass over packed and saves the browser doing the same work
+    summary = {}
+    for item in packed:
+        key = (item['item_type'], item['priority'])
+        entry = summary.get(key)
+        if entry is None:
+            summary[key] = entry = {
+                "item_type": item['item_type'],
+                "priority": item['priority'],
+                "weight": item['weight'],
+                "length": item['length'],
+                "width": item['width'],
+                "height": item['height'],
+                "count": 0
+            }
+        entry['count'] += 1
+
+    # Columnar (SoA) copy of the packed geometry: the crew view's slice
+    # filter reads flat parallel arrays instead of walking nested objects,
+    # and repeated key names drop out of the JSON payload
+    packed_columns = {
+        "ids": [item['id'] for item in packed],
+        "xs": [item['position']['x'] for item in packed],
+        "ys": [item['position']['y'] for item in packed],
+        "zs": [item['position']['z'] for item in packed],
+        "weights": [item['weight'] for item in packed],
+        "lengths": [item['length'] for item in packed],
+        "widths": [item['width'] for item in packed],
+        "heights": [item['height'] for item in packed],
+        "types": [item['item_type'] for item in packed],
+    }
+
     result = {
         "packed": packed,
+        "packed_columns": packed_columns,
+        "packed_summary": list(summary.values()),
         "unpacked": unpacked,
         "stats": {
             "total_weight": current_weight,
@@ -507,6 +722,7 @@ def optimize_cargo():
             "right_weight": round(right_weight, 1)
         },
         "fuel_efficiency": fuel_metrics,
+        "generated_at": time.time(),
         "aircraft": {
             "type": "UH-60 Black Hawk",
             "max_length": max_length,
@@ -515,16 +731,136 @@ def optimize_cargo():
         }
     }
     
-    # Store for ground crew view
+    # Store for ground crew view, memoize for repeat solves, and keep the
+    # snapshot the next warm start builds on
+    if len(_optimize_cache) >= _OPTIMIZE_CACHE_MAX:
+        _optimize_cache.clear()
+    _optimize_cache[cache_key] = result
     latest_load_plan = result
-    
+    _last_solve_state = {
+        'envelope': (max_weight, max_length, max_width, max_height, fast),
+        'counts': req_counts,
+        'packed': packed,
+        'unpacked': unpacked,
+        'next_id': unit_id,
+    }
+
     return jsonify(result)
 
-def find_balanced_position(packed, item, max_length, max_width, max_height, 
-                           front_left_weight, front_right_weight, 
-                           rear_left_weight, rear_right_weight):
+@dataclass
+class PackedArrays:
+    """Columnar (SoA) storage of packed-item weights and positions
+
+    Parallel NumPy arrays instead of per-item dicts so stats like center
+    of gravity reduce to C-level vector ops. The dict representation is
+    still materialized for the JSON boundary; this mirrors it internally.
+    """
+    weights: np.ndarray = field(default_factory=lambda: np.zeros(64))
+    px: np.ndarray = field(default_factory=lambda: np.zeros(64))
+    py: np.ndarray = field(default_factory=lambda: np.zeros(64))
+    pz: np.ndarray = field(default_factory=lambda: np.zeros(64))
+    n: int = 0
+
+    def append(self, weight, position):
+        if self.n == len(self.weights):
+            # Amortized growth, like a Python list
+            for name in ('weights', 'px', 'py', 'pz'):
+                arr = getattr(self, name)
+                setattr(self, name, np.concatenate([arr, np.zeros(len(arr))]))
+        self.weights[self.n] = weight
+        self.px[self.n] = position['x']
+        self.py[self.n] = position['y']
+        self.pz[self.n] = position['z']
+        self.n += 1
+
+# Placement grid resolution in meters (10cm cells). The scan stride adapts
+# to item size, so small items are probed at this resolution while large
+# items take proportionally coarser steps.
+GRID_STEP = 0.1
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - the NumPy slab reduction below is the fallback
+    njit = None
+
+def _slab_is_free(occupancy, x, y, z, item_l, item_w, item_h):
+    """True if the voxel slab a box at corner (x, y, z) would cover is empty"""
+    ix0 = max(int(math.floor(x / GRID_STEP + 1e-9)), 0)
+    ix1 = int(math.ceil((x + item_l) / GRID_STEP - 1e-9))
+    iy0 = max(int(math.floor(y / GRID_STEP + 1e-9)), 0)
+    iy1 = int(math.ceil((y + item_w) / GRID_STEP - 1e-9))
+    iz0 = max(int(math.floor(z / GRID_STEP + 1e-9)), 0)
+    iz1 = int(math.ceil((z + item_h) / GRID_STEP - 1e-9))
+    return not occupancy[ix0:ix1, iy0:iy1, iz0:iz1].any()
+
+if njit is not None:
+    # JIT the per-candidate probe so the extreme-point loop avoids the
+    # interpreter entirely when numba is installed
+    _slab_is_free = njit(cache=True)(_slab_is_free)
+
+def make_occupancy_grid(max_length, max_width, max_height):
+    """Create an empty voxel occupancy grid covering the cargo bay"""
+    nx = int(math.ceil(max_length / GRID_STEP))
+    ny = int(math.ceil(max_width / GRID_STEP))
+    nz = int(math.ceil(max_height / GRID_STEP))
+    return np.zeros((nx, ny, nz), dtype=bool)
+
+def voxel_range(corner, extent):
+    """Convert a box corner + extent (meters) to a conservative voxel index range"""
+    i0 = int(math.floor(corner / GRID_STEP + 1e-9))
+    i1 = int(math.ceil((corner + extent) / GRID_STEP - 1e-9))
+    return max(i0, 0), i1
+
+def attach_position(item, position):
+    """Copy an item, stamping its position and cached AABB extents
+
+    Extents are computed once at placement time so downstream consumers
+    (slice filtering, exports) don't re-derive them from center + dimensions.
+    """
+    placed = item.copy()
+    placed['position'] = position
+    placed['x0'] = position['x'] - item['length'] / 2
+    placed['x1'] = position['x'] + item['length'] / 2
+    placed['y0'] = position['y'] - item['width'] / 2
+    placed['y1'] = position['y'] + item['width'] / 2
+    placed['z0'] = position['z'] - item['height'] / 2
+    placed['z1'] = position['z'] + item['height'] / 2
+    return placed
+
+def mark_occupied(occupancy, top_z, position, item_l, item_w, item_h):
+    """Mark the voxels covered by a placed item (position is the item center)
+
+    Also raises the top_z heightmap over the item's footprint so searches
+    can skip collision checks above the current stack."""
+    ix0, ix1 = voxel_range(position['x'] - item_l / 2, item_l)
+    iy0, iy1 = voxel_range(position['y'] - item_w / 2, item_w)
+    iz0, iz1 = voxel_range(position['z'] - item_h / 2, item_h)
+    occupancy[ix0:ix1, iy0:iy1, iz0:iz1] = True
+    np.maximum(top_z[ix0:ix1, iy0:iy1],
+               position['z'] + item_h / 2,
+               out=top_z[ix0:ix1, iy0:iy1])
+
+def update_extreme_points(extreme_points, position, item_l, item_w, item_h):
+    """Emit new candidate corners from a just-placed box (Extreme-Point heuristic)"""
+    x0 = position['x'] - item_l / 2
+    y0 = position['y'] - item_w / 2
+    z0 = position['z'] - item_h / 2
+    for ep in ((x0 + item_l, y0, z0), (x0, y0 + item_w, z0), (x0, y0, z0 + item_h)):
+        if ep not in extreme_points:
+            extreme_points.append(ep)
+
+def find_balanced_position(occupancy, top_z, item, max_length, max_width, max_height,
+                           front_left_weight, front_right_weight,
+                           rear_left_weight, rear_right_weight,
+                           extreme_points=None, coarse=False):
     """Find the best position for an item considering weight balance in all directions
-    Uses MIRRORED LOADING with SOFT ALTERNATING: prefers balanced sides but allows flexibility"""
+    Uses MIRRORED LOADING with SOFT ALTERNATING: prefers balanced sides but allows flexibility
+
+    Tries extreme points (corners generated by already-placed boxes) first -
+    O(packed) candidates instead of scanning the full lattice - and only
+    falls back to the dense grid scan when no extreme point fits. A chosen
+    extreme point is removed from the list."""
     item_l = item['length']
     item_w = item['width']
     item_h = item['height']
@@ -541,79 +877,131 @@ def find_balanced_position(packed, item, max_length, max_width, max_height,
         # First item - start with front-left
         target_quadrants = [(0, 0), (0, 1), (1, 0), (1, 1)]
     else:
-        # Create a prioritized list that prefers lighter side but includes all quadrants
-        quadrant_weights = {
-            (0, 0): front_left_weight,   # Front-Left
-            (0, 1): front_right_weight,  # Front-Right
-            (1, 0): rear_left_weight,    # Rear-Left
-            (1, 1): rear_right_weight    # Rear-Right
-        }
-        
-        # Sort all quadrants by weight (lightest first)
-        # This naturally alternates sides while still trying all options
-        target_quadrants = sorted(quadrant_weights.keys(), key=lambda q: quadrant_weights[q])
+        # Order quadrants lightest-first (naturally alternates sides while
+        # still trying all options). A tiny stable insertion sort over four
+        # (weight, quadrant) pairs - no dict or keyed sorted() allocation
+        # on every single placement
+        order = [
+            (front_left_weight, (0, 0)),   # Front-Left
+            (front_right_weight, (0, 1)),  # Front-Right
+            (rear_left_weight, (1, 0)),    # Rear-Left
+            (rear_right_weight, (1, 1))    # Rear-Right
+        ]
+        for i in (1, 2, 3):
+            entry = order[i]
+            j = i
+            while j and order[j - 1][0] > entry[0]:
+                order[j] = order[j - 1]
+                j -= 1
+            order[j] = entry
+        target_quadrants = [quadrant for _, quadrant in order]
     
+    # Extreme-point pass: test only corners spawned by previous placements.
+    # Two restrictions keep the fast path from undoing the weight
+    # balancing the function exists for: only floor-level points qualify
+    # (stacked corners cluster weight wherever boxes already are, skewing
+    # the CoG even inside the right quadrant), and the point must put the
+    # item's center in the lightest quadrant - the same attribution the
+    # quadrant weight bookkeeping uses. Anything else falls through to
+    # the balance-aware lattice scan below.
+    if extreme_points:
+        preferred = target_quadrants[0]
+        candidates = [
+            ep for ep in extreme_points
+            if ep[2] == 0.0
+            and (1 if ep[0] + item_l / 2 >= max_length / 2 else 0,
+                 1 if ep[1] + item_w / 2 >= max_width / 2 else 0) == preferred
+        ]
+        candidates.sort(key=lambda ep: (ep[0], ep[1]))
+
+        for ep in candidates:
+            x, y, z = ep
+            if x + item_l > max_length or y + item_w > max_width or z + item_h > max_height:
+                continue
+            # Everything at or above the stack top over this footprint is
+            # known-empty - no need to probe the occupancy slab
+            ix0, ix1 = voxel_range(x, item_l)
+            iy0, iy1 = voxel_range(y, item_w)
+            if z >= top_z[ix0:ix1, iy0:iy1].max() - 1e-9:
+                extreme_points.remove(ep)
+                return {'x': x + item_l / 2, 'y': y + item_w / 2, 'z': z + item_h / 2}
+            if _slab_is_free(occupancy, x, y, z, item_l, item_w, item_h):
+                extreme_points.remove(ep)
+                return {'x': x + item_l / 2, 'y': y + item_w / 2, 'z': z + item_h / 2}
+
+    # Item footprint in voxels
+    cl = max(1, int(math.ceil(item_l / GRID_STEP - 1e-9)))
+    cw = max(1, int(math.ceil(item_w / GRID_STEP - 1e-9)))
+    ch = max(1, int(math.ceil(item_h / GRID_STEP - 1e-9)))
+
+    nx, ny, nz = occupancy.shape
+    if cl > nx or cw > ny or ch > nz:
+        return None
+
+    # Last corner cell where the item still fits inside the real bay
+    # (the grid may overshoot the bay by a partial cell)
+    ix_max = int(math.floor((max_length - item_l) / GRID_STEP + 1e-9))
+    iy_max = int(math.floor((max_width - item_w) / GRID_STEP + 1e-9))
+    iz_max = int(math.floor((max_height - item_h) / GRID_STEP + 1e-9))
+    if ix_max < 0 or iy_max < 0 or iz_max < 0:
+        return None
+
+    # Free-corner mask: one vectorized reduction over all candidate corners
+    # instead of three nested Python loops testing each cell individually.
+    # Corners at or above the stack top are trivially free, so only the
+    # occupied z band is window-reduced.
+    free = np.ones((ix_max + 1, iy_max + 1, iz_max + 1), dtype=bool)
+    band = min(int(math.ceil(top_z.max() / GRID_STEP - 1e-9)), iz_max + 1)
+    if band > 0:
+        zs = min(nz, band + ch - 1)
+        windows = np.lib.stride_tricks.sliding_window_view(occupancy[:, :, :zs], (cl, cw, ch))
+        free[:, :, :band] = ~windows.any(axis=(3, 4, 5))[:ix_max + 1, :iy_max + 1, :band]
+
+    # Quadrant boundary in corner-cell space
+    x_mid = int(math.ceil(max_length / 2 / GRID_STEP - 1e-9))
+    y_mid = int(math.ceil(max_width / 2 / GRID_STEP - 1e-9))
+
+    # Adaptive stride: probe at half the item's smallest dimension, so
+    # candidate count scales with item size instead of a fixed lattice
+    stride = max(1, int(min(item_l, item_w, item_h) / 2 / GRID_STEP))
+    if coarse:
+        # Fast mode trades a sparser candidate lattice for a much cheaper
+        # scan - placements stay collision-exact, just fewer are tried
+        stride *= 2
+
     # Try each quadrant in order of preference
     for rear, right in target_quadrants:
-        # Define search area for this quadrant
-        x_start = (max_length / 2) if rear else 0
-        x_end = max_length if rear else (max_length / 2)
-        y_start = (max_width / 2) if right else 0
-        y_end = max_width if right else (max_width / 2)
-        
-        # Grid search within this quadrant
-        # MIRRORED LOADING: Left side loads left-to-right, right side loads right-to-left
-        step = 0.2  # 20cm steps for better performance
-        
-        for z in [i * step for i in range(int(max_height / step))]:
-            if z + item_h > max_height:
-                continue
-            
-            # Determine Y-axis search direction based on which side we're on
-            y_range = [y_start + i * step for i in range(int((y_end - y_start) / step))]
-            if right:  # Right side: load from right to left (reverse direction)
-                y_range = list(reversed(y_range))
-                
-            for y in y_range:
-                if y + item_w > max_width:
-                    continue
-                    
-                for x in [x_start + i * step for i in range(int((x_end - x_start) / step))]:
-                    if x + item_l > max_length:
-                        continue
-                    
-                    # Check position (center of item)
-                    pos_x = x + item_l / 2
-                    pos_y = y + item_w / 2
-                    pos_z = z + item_h / 2
-                    
-                    # Check if this position overlaps with any packed item
-                    overlaps = False
-                    for p in packed:
-                        if boxes_overlap(
-                            x, y, z, item_l, item_w, item_h,
-                            p['position']['x'] - p['length']/2,
-                            p['position']['y'] - p['width']/2,
-                            p['position']['z'] - p['height']/2,
-                            p['length'], p['width'], p['height']
-                        ):
-                            overlaps = True
-                            break
-                    
-                    if not overlaps:
-                        return {'x': pos_x, 'y': pos_y, 'z': pos_z}
-    
+        ix_off = x_mid if rear else 0
+        iy_off = y_mid if right else 0
+        sub = free[ix_off:(None if rear else x_mid):stride,
+                   iy_off:(None if right else y_mid):stride,
+                   ::stride]
+        if sub.size == 0:
+            continue
+
+        # Scan z lowest-first, then y, then x
+        # MIRRORED LOADING: Left side loads left-to-right, right side right-to-left
+        scan = sub.transpose(2, 1, 0)
+        if right:
+            scan = scan[:, ::-1, :]
+        if not scan.any():
+            continue
+
+        # First free corner in scan order
+        iz, jy, jx = np.unravel_index(int(np.argmax(scan)), scan.shape)
+        if right:
+            jy = sub.shape[1] - 1 - jy
+
+        x = (jx * stride + ix_off) * GRID_STEP
+        y = (jy * stride + iy_off) * GRID_STEP
+        z = iz * stride * GRID_STEP
+
+        # Position is the center of the item
+        return {'x': x + item_l / 2, 'y': y + item_w / 2, 'z': z + item_h / 2}
+
     # If no position found in any quadrant
     return None
 
-def boxes_overlap(x1, y1, z1, l1, w1, h1, x2, y2, z2, l2, w2, h2):
-    """Check if two boxes overlap"""
-    return not (
-        x1 + l1 <= x2 or x2 + l2 <= x1 or
-        y1 + w1 <= y2 or y2 + w2 <= y1 or
-        z1 + h1 <= z2 or z2 + h2 <= z1
-    )
-
 @app.route('/api/latest-plan', methods=['GET'])
 def get_latest_plan():
     """API endpoint for ground crew to get the latest load plan"""
@@ -641,15 +1029,66 @@ def export_pdf():
         download_name='loading_plan.pdf'
     )
 
+@lru_cache(maxsize=4096)
+def _text_width(text, font, size):
+    """Glyph-metric width, cached - labels repeat across items and pages"""
+    return stringWidth(text, font, size)
+
+def _draw_centred(c, x, y, text, font, size):
+    """drawCentredString without re-measuring repeated text every call"""
+    c.drawString(x - _text_width(text, font, size) / 2, y, text)
+
+@lru_cache(maxsize=None)
+def _pdf_color(item_type):
+    """ReportLab Color for an item type, built once per type for the process"""
+    preset = ITEM_PRESETS.get(item_type)
+    if preset and 'color' in preset:
+        r, g, b = preset['color']
+        return colors.Color(r, g, b)
+    return colors.grey
+
 def generate_loading_pdf(packed, max_length, max_width, max_height, stats):
     """Generate a 4-page PDF showing vertical slices of cargo bay"""
-    buffer = io.BytesIO()
+    # Spills to disk past 1MB so big manifests don't hold the whole
+    # document in RAM; Flask streams the file handle in chunks
+    buffer = tempfile.SpooledTemporaryFile(max_size=1 << 20, mode='w+b')
     c = canvas.Canvas(buffer, pagesize=letter)
     width, height = letter
     
     # Define quarters (vertical slices along length)
     quarter_width = max_length / 4
-    
+
+    # Bay geometry and scale factors are identical on every page - compute
+    # them (and the grid path) once instead of per quarter
+    bay_draw_height = 400
+    bay_draw_width = 500
+    bay_x = 50
+    bay_y = height - 550
+
+    # Scale factors
+    scale_w = bay_draw_width / max_width
+    scale_h = bay_draw_height / max_height
+
+    # Items repeat across the four slices - build the per-item text caches
+    # once for the document rather than once per page
+    display_name = {t: (t[:12] + "...") if len(t) > 15 else t
+                    for t in {i['item_type'] for i in packed}}
+    legend_text = {it['id']: "ID" + str(it['id']) + ": " + it['item_type'] + " - "
+                   + str(it['weight']) + "kg - Priority " + str(it['priority'])
+                   for it in packed}
+    id_str = {it['id']: f"ID{it['id']}" for it in packed}
+    weight_str = {t: f"{p['weight']}kg" for t, p in ITEM_PRESETS.items() if 'weight' in p}
+
+    grid = c.beginPath()
+    for i in range(1, int(max_width) + 1):
+        x = bay_x + i * scale_w
+        grid.moveTo(x, bay_y)
+        grid.lineTo(x, bay_y + bay_draw_height)
+    for i in range(1, int(max_height) + 1):
+        y = bay_y + i * scale_h
+        grid.moveTo(bay_x, y)
+        grid.lineTo(bay_x + bay_draw_width, y)
+
     for quarter in range(4):
         # Calculate slice boundaries
         slice_start = quarter * quarter_width
@@ -658,11 +1097,10 @@ def generate_loading_pdf(packed, max_length, max_width, max_height, stats):
         # Filter items in this slice
         items_in_slice = []
         for item in packed:
-            item_x = item['position']['x']
-            item_length = item['length']
-            item_start = item_x - item_length/2
-            item_end = item_x + item_length/2
-            
+            # Use cached AABB extents when present (set at placement time)
+            item_start = item.get('x0', item['position']['x'] - item['length']/2)
+            item_end = item.get('x1', item['position']['x'] + item['length']/2)
+
             # Check if item overlaps with this slice
             if item_start < slice_end and item_end > slice_start:
                 items_in_slice.append(item)
@@ -684,16 +1122,6 @@ def generate_loading_pdf(packed, max_length, max_width, max_height, stats):
         cog = stats.get('center_of_gravity', {})
         c.drawString(400, height - 126, f"CoG: X:{cog.get('x', 0):.1f} Y:{cog.get('y', 0):.1f} Z:{cog.get('z', 0):.1f}m")
         
-        # Draw cargo bay outline (top view)
-        bay_draw_height = 400
-        bay_draw_width = 500
-        bay_x = 50
-        bay_y = height - 550
-        
-        # Scale factors
-        scale_w = bay_draw_width / max_width
-        scale_h = bay_draw_height / max_height
-        
         # Draw bay outline
         c.setStrokeColor(colors.black)
         c.setLineWidth(2)
@@ -708,58 +1136,62 @@ def generate_loading_pdf(packed, max_length, max_width, max_height, stats):
         c.drawString(-30, 0, "Height (m)")
         c.restoreState()
         
-        # Draw grid
+        # Draw grid - the path was built once above, one drawPath per page
         c.setStrokeColor(colors.lightgrey)
         c.setLineWidth(0.5)
-        for i in range(1, int(max_width) + 1):
-            x = bay_x + i * scale_w
-            c.line(x, bay_y, x, bay_y + bay_draw_height)
-        for i in range(1, int(max_height) + 1):
-            y = bay_y + i * scale_h
-            c.line(bay_x, y, bay_x + bay_draw_width, y)
-        
-        # Draw items in this slice
-        for idx, item in enumerate(items_in_slice):
-            pos_y = item['position']['y']
-            pos_z = item['position']['z']
-            item_width = item['width']
-            item_height = item['height']
-            
-            # Calculate box position (centered)
-            box_x = bay_x + (pos_y - item_width/2) * scale_w
-            box_y = bay_y + (pos_z - item_height/2) * scale_h
-            box_w = item_width * scale_w
-            box_h = item_height * scale_h
-            
-            # Get color from item type
-            item_type = item['item_type']
-            if item_type in ITEM_PRESETS and 'color' in ITEM_PRESETS[item_type]:
-                rgb = ITEM_PRESETS[item_type]['color']
-                color = colors.Color(rgb[0], rgb[1], rgb[2])
-            else:
-                # Fallback to gray
-                color = colors.grey
-            
-            # Draw box
+        c.drawPath(grid, stroke=1, fill=0)
+
+        # Empty slice: keep the header, outline and page number but skip
+        # the item and legend passes entirely
+        if not items_in_slice:
+            c.setFont("Helvetica", 10)
+            c.drawString(width - 100, 30, f"Page {quarter + 1} of 4")
+            c.showPage()
+            continue
+
+        # Compute box geometry once, then batch rectangles by fill color:
+        # one path + one drawPath per color group instead of a canvas
+        # round-trip (setFillColor/rect) per item
+        n = len(items_in_slice)
+        if n:
+            py = np.fromiter((it['position']['y'] for it in items_in_slice), float, n)
+            pz = np.fromiter((it['position']['z'] for it in items_in_slice), float, n)
+            iw = np.fromiter((it['width'] for it in items_in_slice), float, n)
+            ih = np.fromiter((it['height'] for it in items_in_slice), float, n)
+            # All four coordinates for every box in four array ops
+            boxes = np.column_stack((bay_x + (py - iw / 2) * scale_w,
+                                     bay_y + (pz - ih / 2) * scale_h,
+                                     iw * scale_w,
+                                     ih * scale_h))
+        else:
+            boxes = ()
+
+        boxes_by_color = defaultdict(list)
+        for item, box in zip(items_in_slice, boxes):
+            boxes_by_color[_pdf_color(item['item_type'])].append(box)
+
+        c.setStrokeColor(colors.black)
+        c.setLineWidth(1.5)
+        for color, group in boxes_by_color.items():
             c.setFillColor(color)
-            c.setStrokeColor(colors.black)
-            c.setLineWidth(1.5)
-            c.rect(box_x, box_y, box_w, box_h, fill=1, stroke=1)
-            
-            # Draw label
-            c.setFillColor(colors.white)
-            c.setFont("Helvetica-Bold", 8)
-            label = f"ID{item['id']}"
-            c.drawCentredString(box_x + box_w/2, box_y + box_h/2 + 8, label)
-            
-            c.setFont("Helvetica", 7)
-            weight = f"{item['weight']}kg"
-            c.drawCentredString(box_x + box_w/2, box_y + box_h/2 - 2, weight)
-            
-            item_name = item['item_type']
-            if len(item_name) > 15:
-                item_name = item_name[:12] + "..."
-            c.drawCentredString(box_x + box_w/2, box_y + box_h/2 - 12, item_name)
+            path = c.beginPath()
+            for box_x, box_y, box_w, box_h in group:
+                path.rect(box_x, box_y, box_w, box_h)
+            c.drawPath(path, stroke=1, fill=1)
+
+        # Labels drawn after all boxes so text stays on top. Font and fill
+        # state is set once per pass instead of once per item, so the
+        # content stream carries one state switch per pass
+        c.setFillColor(colors.white)
+        c.setFont("Helvetica-Bold", 8)
+        for item, (box_x, box_y, box_w, box_h) in zip(items_in_slice, boxes):
+            _draw_centred(c, box_x + box_w/2, box_y + box_h/2 + 8, id_str[item['id']], "Helvetica-Bold", 8)
+
+        c.setFont("Helvetica", 7)
+        for item, (box_x, box_y, box_w, box_h) in zip(items_in_slice, boxes):
+            weight = weight_str.get(item['item_type']) or f"{item['weight']}kg"
+            _draw_centred(c, box_x + box_w/2, box_y + box_h/2 - 2, weight, "Helvetica", 7)
+            _draw_centred(c, box_x + box_w/2, box_y + box_h/2 - 12, display_name[item['item_type']], "Helvetica", 7)
         
         # Draw legend
         legend_y = 150
@@ -769,26 +1201,27 @@ def generate_loading_pdf(packed, max_length, max_width, max_height, stats):
         c.setFont("Helvetica", 9)
         legend_y -= 20
         
-        for idx, item in enumerate(items_in_slice):
-            if legend_y < 50:  # Don't overflow page
-                c.drawString(50, legend_y, "...and more")
-                break
-            
-            # Get color from item type
-            item_type = item['item_type']
-            if item_type in ITEM_PRESETS and 'color' in ITEM_PRESETS[item_type]:
-                rgb = ITEM_PRESETS[item_type]['color']
-                color = colors.Color(rgb[0], rgb[1], rgb[2])
-            else:
-                color = colors.grey
-            
+        # Rows are a fixed 18pt, so how many fit above the 50pt page margin
+        # is known up front - slice instead of testing overflow per row
+        max_rows = (legend_y - 50) // 18 + 1
+        shown = items_in_slice[:max_rows]
+        legend_rows = [(item, legend_y - 18 * i) for i, item in enumerate(shown)]
+
+        swatch_ys = defaultdict(list)
+        for item, row_y in legend_rows:
+            swatch_ys[_pdf_color(item['item_type'])].append(row_y)
+        for color, ys in swatch_ys.items():
             c.setFillColor(color)
-            c.rect(50, legend_y - 8, 12, 12, fill=1, stroke=1)
-            
-            c.setFillColor(colors.black)
-            text = f"ID{item['id']}: {item['item_type']} - {item['weight']}kg - Priority {item['priority']}"
-            c.drawString(70, legend_y - 4, text)
-            legend_y -= 18
+            path = c.beginPath()
+            for row_y in ys:
+                path.rect(50, row_y - 8, 12, 12)
+            c.drawPath(path, stroke=1, fill=1)
+
+        c.setFillColor(colors.black)
+        for item, row_y in legend_rows:
+            c.drawString(70, row_y - 4, legend_text[item['id']])
+        if len(items_in_slice) > max_rows:
+            c.drawString(50, legend_y - 18 * len(shown), "...and more")
         
         # Add page number
         c.setFont("Helvetica", 10)
@@ -809,13 +1242,11 @@ def export_openscad():
     max_height = float(data.get('max_height', 2.5))
     stats = data.get('stats', {})
     
-    # Generate OpenSCAD code
-    scad_code = generate_openscad(packed, max_length, max_width, max_height, stats)
-    
-    # Create file in memory
-    output = io.BytesIO()
-    output.write(scad_code.encode('utf-8'))
-    output.seek(0)
+    # Generate OpenSCAD code into a bytearray - amortized O(1) growth and
+    # no str->bytes copy of the full document at the end
+    buf = bytearray()
+    generate_openscad(buf, packed, max_length, max_width, max_height, stats)
+    output = io.BytesIO(bytes(buf))
     
     return send_file(
         output,
@@ -824,34 +1255,14 @@ def export_openscad():
         download_name='cargo_manifest.scad'
     )
 
-def generate_openscad(packed, max_length, max_width, max_height, stats):
-    """Generate OpenSCAD code with semi-cylindrical cargo bay"""
-    
-    # Convert meters to mm for better OpenSCAD visualization
-    scale = 1000
-    
-    scad = """// Military Cargo Loading Manifest
+# Static OpenSCAD blocks, encoded once at import time
+
+SCAD_HEADER = b"""// Military Cargo Loading Manifest
 // Generated by Space Optimizer
 
 """
-    
-    # Add statistics as comments
-    scad += f"""// === CARGO STATISTICS ===
-// Total Weight: {stats.get('total_weight', 0):.1f} kg / {stats.get('max_weight', 0):.0f} kg
-// Weight Utilization: {stats.get('weight_utilization', 0):.2f}%
-// Volume Utilization: {stats.get('volume_utilization', 0):.2f}%
-// Items Packed: {stats.get('items_packed', 0)}
-// Items Unpacked: {stats.get('items_unpacked', 0)}
 
-"""
-    
-    # OpenSCAD parameters - increase dimensions by 25% for better visibility
-    scad += f"""// === CARGO BAY DIMENSIONS (mm) ===
-// Note: Dimensions increased by 25% for better visualization
-bay_length = {max_length * scale * 1.25};
-bay_width = {max_width * scale * 1.25};
-bay_height = {max_height * scale * 1.5};  // Extra height for top clearance
-wall_thickness = 20;
+SCAD_PARAMS = """wall_thickness = 20;
 
 // Text settings
 text_size = 50;
@@ -859,10 +1270,9 @@ text_depth = 2;
 
 $fn = 50; // Smooth curves
 
-"""
-    
-    # Module for semi-cylindrical cargo bay
-    scad += """// === SEMI-CYLINDRICAL CARGO BAY ===
+""".encode('utf-8')
+
+SCAD_BAY_MODULE = """// === SEMI-CYLINDRICAL CARGO BAY ===
 module cargo_bay() {
     color([0.3, 0.3, 0.3, 0.3]) {
         difference() {
@@ -895,39 +1305,43 @@ module cargo_bay() {
     }
 }
 
-"""
-    
-    # Module for cargo box with label
-    scad += """// === CARGO BOX MODULE ===
+""".encode('utf-8')
+
+SCAD_BOX_MODULE = """// === CARGO EDGE WIREFRAME ===
+// Tiny marker cylinders don't need the global $fn = 50 - coarse facets
+// are invisible at this size and render much faster
+module cargo_edges(l, w, h) {
+    edge_r = 2;
+    $fn = 8;
+
+    // Bottom edges
+    translate([0, 0, -h/2]) {
+        translate([l/2, 0, 0]) rotate([0, 90, 0]) cylinder(h=edge_r, r=edge_r, center=true);
+        translate([-l/2, 0, 0]) rotate([0, 90, 0]) cylinder(h=edge_r, r=edge_r, center=true);
+        translate([0, w/2, 0]) rotate([90, 0, 0]) cylinder(h=edge_r, r=edge_r, center=true);
+        translate([0, -w/2, 0]) rotate([90, 0, 0]) cylinder(h=edge_r, r=edge_r, center=true);
+    }
+
+    // Top edges
+    translate([0, 0, h/2]) {
+        translate([l/2, 0, 0]) rotate([0, 90, 0]) cylinder(h=edge_r, r=edge_r, center=true);
+        translate([-l/2, 0, 0]) rotate([0, 90, 0]) cylinder(h=edge_r, r=edge_r, center=true);
+        translate([0, w/2, 0]) rotate([90, 0, 0]) cylinder(h=edge_r, r=edge_r, center=true);
+        translate([0, -w/2, 0]) rotate([90, 0, 0]) cylinder(h=edge_r, r=edge_r, center=true);
+    }
+}
+
+// === CARGO BOX MODULE ===
 module cargo_box(x, y, z, l, w, h, color_vec, label_text, weight_text) {
     translate([x, y, z]) {
         // Box
         color(color_vec)
             cube([l, w, h], center=true);
-        
+
         // Box edges
         color([0, 0, 0])
-            translate([0, 0, 0]) {
-                // Edge wireframe
-                edge_r = 2;
-                
-                // Bottom edges
-                translate([0, 0, -h/2]) {
-                    translate([l/2, 0, 0]) rotate([0, 90, 0]) cylinder(h=edge_r, r=edge_r, center=true);
-                    translate([-l/2, 0, 0]) rotate([0, 90, 0]) cylinder(h=edge_r, r=edge_r, center=true);
-                    translate([0, w/2, 0]) rotate([90, 0, 0]) cylinder(h=edge_r, r=edge_r, center=true);
-                    translate([0, -w/2, 0]) rotate([90, 0, 0]) cylinder(h=edge_r, r=edge_r, center=true);
-                }
-                
-                // Top edges
-                translate([0, 0, h/2]) {
-                    translate([l/2, 0, 0]) rotate([0, 90, 0]) cylinder(h=edge_r, r=edge_r, center=true);
-                    translate([-l/2, 0, 0]) rotate([0, 90, 0]) cylinder(h=edge_r, r=edge_r, center=true);
-                    translate([0, w/2, 0]) rotate([90, 0, 0]) cylinder(h=edge_r, r=edge_r, center=true);
-                    translate([0, -w/2, 0]) rotate([90, 0, 0]) cylinder(h=edge_r, r=edge_r, center=true);
-                }
-            }
-        
+            cargo_edges(l, w, h);
+
         // Label on top
         color([1, 1, 1])
             translate([0, 0, h/2 + text_depth/2])
@@ -943,44 +1357,85 @@ module cargo_box(x, y, z, l, w, h, color_vec, label_text, weight_text) {
     }
 }
 
-"""
-    
-    # Main assembly
-    scad += """// === MAIN ASSEMBLY ===
+""".encode('utf-8')
+
+SCAD_MAIN_ASSEMBLY = """// === MAIN ASSEMBLY ===
 cargo_bay();
 
-"""
+""".encode('utf-8')
+
+# All per-item cargo_box calls rendered in one pass by a template that is
+# compiled to bytecode once at import time
+_SCAD_ENV = Environment(loader=BaseLoader(), autoescape=False, auto_reload=False)
+SCAD_ITEMS_TPL = _SCAD_ENV.from_string(
+    """{% for it in items %}// Item {{ it.id }}: {{ it.type }} (Priority: {{ it.priority }})
+cargo_box({{ it.x }}, {{ it.y }}, {{ it.z }}, {{ it.l }}, {{ it.w }}, {{ it.h }}, {{ it.color }}, "{{ it.label }}", "{{ it.wlabel }}");
+
+{% endfor %}""")
+
+def generate_openscad(buf, packed, max_length, max_width, max_height, stats):
+    """Append OpenSCAD code for a semi-cylindrical cargo bay to a bytearray"""
     
-    for idx, item in enumerate(packed):
-        # Get color from item type
-        item_type = item['item_type']
-        if item_type in ITEM_PRESETS and 'color' in ITEM_PRESETS[item_type]:
-            rgb = ITEM_PRESETS[item_type]['color']
-            color = f"[{rgb[0]}, {rgb[1]}, {rgb[2]}, 0.8]"
-        else:
-            # Fallback to blue if color not found
-            color = "[0.5, 0.5, 0.8, 0.8]"
-        
-        # Convert position and dimensions to mm
-        # Scale up by 1.25 to match the larger bay
-        x = item['position']['x'] * scale * 1.25
-        y = item['position']['y'] * scale * 1.25
-        z = item['position']['z'] * scale * 1.5  # Height scaled 1.5x
-        l = item['length'] * scale
-        w = item['width'] * scale
-        h = item['height'] * scale
-        
-        # Create label
-        label = f"ID{item['id']}"
-        weight_label = f"{item['weight']}kg"
-        
-        scad += f"""// Item {item['id']}: {item['item_type']} (Priority: {item['priority']})
-cargo_box({x}, {y}, {z}, {l}, {w}, {h}, {color}, "{label}", "{weight_label}");
+    # Convert meters to mm for better OpenSCAD visualization
+    scale = 1000
 
-"""
+    # Precompute color vectors per item type (fallback to blue if color not found)
+    scad_colors = {t: f"[{p['color'][0]}, {p['color'][1]}, {p['color'][2]}, 0.8]"
+                   for t, p in ITEM_PRESETS.items() if 'color' in p}
+
+    buf.extend(SCAD_HEADER)
+    
+    # Add statistics as comments
+    buf.extend(f"""// === CARGO STATISTICS ===
+// Total Weight: {stats.get('total_weight', 0):.1f} kg / {stats.get('max_weight', 0):.0f} kg
+// Weight Utilization: {stats.get('weight_utilization', 0):.2f}%
+// Volume Utilization: {stats.get('volume_utilization', 0):.2f}%
+// Items Packed: {stats.get('items_packed', 0)}
+// Items Unpacked: {stats.get('items_unpacked', 0)}
+
+""".encode('utf-8'))
+    
+    # OpenSCAD parameters - increase dimensions by 25% for better visibility
+    buf.extend(f"""// === CARGO BAY DIMENSIONS (mm) ===
+// Note: Dimensions increased by 25% for better visualization
+bay_length = {max_length * scale * 1.25};
+bay_width = {max_width * scale * 1.25};
+bay_height = {max_height * scale * 1.5};  // Extra height for top clearance
+""".encode('utf-8'))
+    buf.extend(SCAD_PARAMS)
+    
+    # Module for semi-cylindrical cargo bay
+    buf.extend(SCAD_BAY_MODULE)
+    
+    # Module for cargo box with label
+    buf.extend(SCAD_BOX_MODULE)
+    
+    # Main assembly
+    buf.extend(SCAD_MAIN_ASSEMBLY)
+    
+    # Convert position and dimensions to mm in one broadcast multiply;
+    # positions scale up by 1.25 (height 1.5) to match the larger bay.
+    # All items then render in a single precompiled template pass
+    geom = np.array([[item['position']['x'], item['position']['y'], item['position']['z'],
+                      item['length'], item['width'], item['height']]
+                     for item in packed], dtype=np.float64).reshape(-1, 6)
+    geom *= np.array([scale * 1.25, scale * 1.25, scale * 1.5, scale, scale, scale])
+
+    prepared = []
+    for item, (x, y, z, l, w, h) in zip(packed, geom):
+        prepared.append({
+            'id': item['id'],
+            'type': item['item_type'],
+            'priority': item['priority'],
+            'color': scad_colors.get(item['item_type'], "[0.5, 0.5, 0.8, 0.8]"),
+            'x': x, 'y': y, 'z': z, 'l': l, 'w': w, 'h': h,
+            'label': f"ID{item['id']}",
+            'wlabel': f"{item['weight']}kg",
+        })
+    buf.extend(SCAD_ITEMS_TPL.render(items=prepared).encode('utf-8'))
     
     # Add legend/info panel
-    scad += f"""
+    buf.extend(f"""
 // === INFO PANEL ===
 color([0.2, 0.2, 0.2, 0.9])
     translate([bay_length + 500, bay_width/2, bay_height/2])
@@ -1008,17 +1463,30 @@ color([0.8, 0.8, 0.8]) {{
         linear_extrude(height=5)
             text("Unpacked: {stats.get('items_unpacked', 0)}", size=50, halign="center", valign="center");
 }}
-"""
+""".encode('utf-8'))
     
-    return scad
+
+# Presets never change at runtime: serialize once at startup and serve
+# with a strong ETag so repeat fetches short-circuit to 304
+_ITEM_PRESETS_JSON = json.dumps(ITEM_PRESETS).encode()
+_ITEM_PRESETS_ETAG = hashlib.md5(_ITEM_PRESETS_JSON).hexdigest()
+_AIRCRAFT_PRESETS_JSON = json.dumps(AIRCRAFT_PRESETS).encode()
+_AIRCRAFT_PRESETS_ETAG = hashlib.md5(_AIRCRAFT_PRESETS_JSON).hexdigest()
+
+def _cached_json(body, etag):
+    if etag in request.if_none_match:
+        return '', 304
+    resp = Response(body, mimetype='application/json')
+    resp.set_etag(etag)
+    return resp
 
 @app.route('/api/item-presets', methods=['GET'])
 def get_item_presets():
-    return jsonify(ITEM_PRESETS)
+    return _cached_json(_ITEM_PRESETS_JSON, _ITEM_PRESETS_ETAG)
 
 @app.route('/api/aircraft-presets', methods=['GET'])
 def get_aircraft_presets():
-    return jsonify(AIRCRAFT_PRESETS)
+    return _cached_json(_AIRCRAFT_PRESETS_JSON, _AIRCRAFT_PRESETS_ETAG)
 
 
 HTML_TEMPLATE = '''
@@ -1031,6 +1499,8 @@ HTML_TEMPLATE = '''
     <script src="https://cdn.tailwindcss.com"></script>
 </head>
 <body class="bg-gray-100 text-gray-800 min-h-screen">
+    <!-- Non-blocking error/status toast -->
+    <div id="toast" class="hidden fixed bottom-6 right-6 bg-gray-800 text-white px-4 py-3 rounded-lg shadow-lg z-50"></div>
     <div class="container mx-auto px-4 py-8">
         <header class="mb-8 flex items-center gap-6">
             <div class="flex items-center">
@@ -1117,7 +1587,11 @@ HTML_TEMPLATE = '''
                         <input type="text" value="1.3" readonly class="w-full bg-gray-100 border-2 border-gray-300 rounded px-3 py-2 cursor-not-allowed text-gray-700">
                     </div>
                 </div>
-                <button onclick="generateManifest()" class="w-full text-white font-bold py-4 px-6 rounded-lg text-xl transition" style="background-color: #72A7C0;">
+                <label class="flex items-center gap-2 mb-3 text-sm text-gray-700">
+                    <input type="checkbox" id="fastMode" class="rounded border-gray-300">
+                    Fast mode (coarser placement search, quicker layout)
+                </label>
+                <button onclick="generateManifestDebounced()" class="w-full text-white font-bold py-4 px-6 rounded-lg text-xl transition" style="background-color: #72A7C0;">
                     Generate Layout
                 </button>
             </div>
@@ -1241,7 +1715,34 @@ HTML_TEMPLATE = '''
         let lastOptimizationResult = null;
         let lastAircraftConfig = null;
 
+        // Tiny IndexedDB key-value store so a page reload can restore the
+        // last plan without a network round trip (or a re-solve)
+        function idbStore(mode, fn) {
+            return new Promise((resolve, reject) => {
+                const open = indexedDB.open('cargo-planner', 1);
+                open.onupgradeneeded = () => open.result.createObjectStore('kv');
+                open.onerror = () => reject(open.error);
+                open.onsuccess = () => {
+                    const tx = open.result.transaction('kv', mode);
+                    const req = fn(tx.objectStore('kv'));
+                    tx.oncomplete = () => { open.result.close(); resolve(req.result); };
+                    tx.onerror = () => { open.result.close(); reject(tx.error); };
+                };
+            });
+        }
+        const idbGet = (key) => idbStore('readonly', (store) => store.get(key));
+        const idbSet = (key, value) => idbStore('readwrite', (store) => store.put(value, key));
+        const idbDel = (key) => idbStore('readwrite', (store) => store.delete(key));
+
         async function init() {
+            try {
+                const cached = await idbGet('lastPlan');
+                if (cached && cached.result) {
+                    lastOptimizationResult = cached.result;
+                    lastAircraftConfig = cached.config;
+                    displayResults(cached.result);
+                }
+            } catch (e) { /* IndexedDB unavailable (e.g. private mode) */ }
             await loadItemPresets();
             await loadAircraftPresets();
             await loadRequests();
@@ -1324,8 +1825,9 @@ HTML_TEMPLATE = '''
             
             const tbody = document.getElementById('requestsTable');
             tbody.innerHTML = '';
-            
-            // Group requests by item_type and priority
+
+            // Requests arrive as (item_type, priority, count) buckets;
+            // merge buckets sharing a key
             const grouped = {};
             requests.forEach(req => {
                 const key = `${req.item_type}_${req.priority}`;
@@ -1340,7 +1842,7 @@ HTML_TEMPLATE = '''
                         count: 0
                     };
                 }
-                grouped[key].count++;
+                grouped[key].count += req.count;
             });
             
             // Display grouped items
@@ -1368,6 +1870,30 @@ HTML_TEMPLATE = '''
             return 'bg-green-600 text-white';
         }
 
+        // Toast instead of alert() so errors don't block the main thread
+        let toastTimer = null;
+        function showToast(message) {
+            const toast = document.getElementById('toast');
+            toast.textContent = message;
+            toast.classList.remove('hidden');
+            clearTimeout(toastTimer);
+            toastTimer = setTimeout(() => toast.classList.add('hidden'), 4000);
+        }
+
+        // In-flight optimize request; a fresh click aborts the stale one
+        // so mashing Generate doesn't queue redundant solves
+        let optimizeController = null;
+
+        // Trailing-edge debounce: repeated Generate clicks collapse into
+        // one solve for the final parameter set
+        const debounce = (fn, ms) => {
+            let t;
+            return (...args) => {
+                clearTimeout(t);
+                t = setTimeout(() => fn(...args), ms);
+            };
+        };
+
         async function generateManifest() {
             // Use locked UH-60 Black Hawk specs
             const maxWeight = 1200;
@@ -1375,6 +1901,9 @@ HTML_TEMPLATE = '''
             const maxWidth = 2.2;
             const maxHeight = 1.3;
             
+            if (optimizeController) optimizeController.abort();
+            optimizeController = new AbortController();
+
             try {
                 const response = await fetch('/api/optimize', {
                     method: 'POST',
@@ -1383,8 +1912,10 @@ HTML_TEMPLATE = '''
                         max_weight: maxWeight,
                         max_length: maxLength,
                         max_width: maxWidth,
-                        max_height: maxHeight
-                    })
+                        max_height: maxHeight,
+                        fast: document.getElementById('fastMode').checked
+                    }),
+                    signal: optimizeController.signal
                 });
                 
                 if (!response.ok) {
@@ -1401,11 +1932,14 @@ HTML_TEMPLATE = '''
                 };
                 
                 displayResults(result);
+                idbSet('lastPlan', { result, config: lastAircraftConfig, ts: Date.now() }).catch(() => {});
             } catch (error) {
+                if (error.name === 'AbortError') return; // superseded by a newer click
                 console.error('Error generating manifest:', error);
-                alert('Error generating layout. Please check the console for details.');
+                showToast('Error generating layout. Please check the console for details.');
             }
         }
+        const generateManifestDebounced = debounce(generateManifest, 200);
 
         function displayResults(result) {
             document.getElementById('resultsSection').classList.remove('hidden');
@@ -1431,35 +1965,33 @@ HTML_TEMPLATE = '''
             }
             
             // Update the requests table to show actual packed quantities (including auto-filled)
-            updateRequestsTableWithActuals(result.packed);
+            updateRequestsTableWithActuals(result.packed_summary || []);
         }
         
-        function updateRequestsTableWithActuals(packedItems) {
+        // Rendered rows keyed by type+priority, so a re-render after each
+        // solve mutates the count cell in place instead of re-parsing the
+        // whole table body from innerHTML
+        const requestRowCache = new Map();
+
+        function updateRequestsTableWithActuals(summaryRows) {
             const tbody = document.getElementById('requestsTable');
-            tbody.innerHTML = '';
-            
-            // Group packed items by item_type and priority
-            const grouped = {};
-            packedItems.forEach(item => {
+
+            // Rows arrive pre-grouped from the server (packed_summary) -
+            // no client-side aggregation pass needed
+            // Reuse existing rows where possible; only the count changes
+            // for a given key
+            const seen = new Set();
+            summaryRows.forEach(item => {
                 const key = `${item.item_type}_${item.priority}`;
-                if (!grouped[key]) {
-                    grouped[key] = {
-                        item_type: item.item_type,
-                        priority: item.priority,
-                        weight: item.weight,
-                        length: item.length,
-                        width: item.width,
-                        height: item.height,
-                        count: 0
-                    };
+                seen.add(key);
+                let row = requestRowCache.get(key);
+                if (row && row.parentNode === tbody) {
+                    row.children[2].textContent = item.count;
+                    return;
                 }
-                grouped[key].count++;
-            });
-            
-            // Display grouped items
-            Object.values(grouped).forEach(item => {
-                const row = document.createElement('tr');
+                row = document.createElement('tr');
                 row.className = 'hover:bg-gray-50';
+                row.dataset.key = key;
                 row.innerHTML = `
                     <td class="px-4 py-2">${item.item_type}</td>
                     <td class="px-4 py-2">
@@ -1471,67 +2003,80 @@ HTML_TEMPLATE = '''
                     <td class="px-4 py-2">${item.weight}</td>
                     <td class="px-4 py-2">${item.length} × ${item.width} × ${item.height}</td>
                 `;
+                requestRowCache.set(key, row);
                 tbody.appendChild(row);
             });
-        }
 
-        async function downloadOpenSCAD() {
-            if (!lastOptimizationResult || !lastAircraftConfig) {
-                alert('Please generate a manifest first');
-                return;
+            // Drop rows whose key vanished, plus anything another render
+            // path (loadRequests) left behind
+            for (const row of Array.from(tbody.children)) {
+                const key = row.dataset.key;
+                if (!key || !seen.has(key)) {
+                    row.remove();
+                    if (key) requestRowCache.delete(key);
+                }
             }
-            
-            const response = await fetch('/api/export-openscad', {
+        }
+
+        // Stream a POSTed export straight to disk when the File System
+        // Access API is available - no full-file blob held in memory.
+        // Browsers without showSaveFilePicker keep the blob + anchor path.
+        async function streamDownload(endpoint, body, filename) {
+            const response = await fetch(endpoint, {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    packed: lastOptimizationResult.packed,
-                    max_length: lastAircraftConfig.max_length,
-                    max_width: lastAircraftConfig.max_width,
-                    max_height: lastAircraftConfig.max_height,
-                    stats: lastOptimizationResult.stats
-                })
+                body: body
             });
-            
+
+            if (window.showSaveFilePicker) {
+                let writable = null;
+                try {
+                    const handle = await window.showSaveFilePicker({ suggestedName: filename });
+                    writable = await handle.createWritable();
+                } catch (err) {
+                    if (err.name === 'AbortError') return; // user cancelled the picker
+                    writable = null; // fall back below
+                }
+                if (writable) {
+                    await response.body.pipeTo(writable);
+                    return;
+                }
+            }
+
             const blob = await response.blob();
             const url = window.URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
-            a.download = 'cargo_manifest.scad';
+            a.download = filename;
             document.body.appendChild(a);
             a.click();
             window.URL.revokeObjectURL(url);
             document.body.removeChild(a);
         }
 
-        async function downloadPDF() {
+        // One downloader body shared by every export button - only the
+        // endpoint, filename and missing-plan message differ
+        const makeDownloader = (endpoint, filename, missingMsg) => async () => {
             if (!lastOptimizationResult || !lastAircraftConfig) {
-                alert('Please generate a manifest first');
+                showToast(missingMsg);
                 return;
             }
-            
-            const response = await fetch('/api/export-pdf', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    packed: lastOptimizationResult.packed,
-                    max_length: lastAircraftConfig.max_length,
-                    max_width: lastAircraftConfig.max_width,
-                    max_height: lastAircraftConfig.max_height,
-                    stats: lastOptimizationResult.stats
-                })
-            });
-            
-            const blob = await response.blob();
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = 'loading_plan.pdf';
-            document.body.appendChild(a);
-            a.click();
-            window.URL.revokeObjectURL(url);
-            document.body.removeChild(a);
-        }
+
+            await streamDownload(endpoint, JSON.stringify({
+                packed: lastOptimizationResult.packed,
+                max_length: lastAircraftConfig.max_length,
+                max_width: lastAircraftConfig.max_width,
+                max_height: lastAircraftConfig.max_height,
+                stats: lastOptimizationResult.stats
+            }), filename);
+        };
+
+        const downloadOpenSCAD = makeDownloader(
+            '/api/export-openscad', 'cargo_manifest.scad', 'Please generate a manifest first');
+        const downloadPDF = makeDownloader(
+            '/api/export-pdf', 'loading_plan.pdf', 'Please generate a manifest first');
+        const downloadLoadingCrewPDF = makeDownloader(
+            '/api/export-pdf', 'loading_plan.pdf', 'No load plan available to download');
 
         async function clearAllRequests() {
             if (!confirm('Are you sure you want to clear all cargo requests?')) {
@@ -1550,23 +2095,38 @@ HTML_TEMPLATE = '''
                 document.getElementById('resultsSection').classList.add('hidden');
                 lastOptimizationResult = null;
                 lastAircraftConfig = null;
+                idbDel('lastPlan').catch(() => {});
             }
         }
 
         // Loading Crew View Functions
         async function loadLoadingCrewPlan() {
+            let cached = null;
+            try {
+                cached = await idbGet('lastPlan');
+                if (cached && cached.result && cached.result.aircraft) {
+                    // Paint the cached plan instantly; the fetch below only
+                    // re-renders if the server has a newer one
+                    displayLoadingCrewPlan(cached.result);
+                }
+            } catch (e) { /* IndexedDB unavailable */ }
             try {
                 const response = await fetch('/api/latest-plan');
                 
                 if (response.ok) {
                     const plan = await response.json();
-                    displayLoadingCrewPlan(plan);
-                } else {
+                    if (!cached || !cached.result ||
+                        plan.generated_at !== cached.result.generated_at) {
+                        displayLoadingCrewPlan(plan);
+                    }
+                } else if (!cached || !cached.result || !cached.result.aircraft) {
                     showNoPlanMessage();
                 }
             } catch (error) {
                 console.error('Error loading plan:', error);
-                showNoPlanMessage();
+                if (!cached || !cached.result || !cached.result.aircraft) {
+                    showNoPlanMessage();
+                }
             }
         }
 
@@ -1600,24 +2160,108 @@ HTML_TEMPLATE = '''
             const maxWidth = plan.aircraft.max_width;
             const maxHeight = plan.aircraft.max_height;
             const quarterWidth = maxLength / 4;
-            
-            // Create 4 slices
-            for (let quarter = 0; quarter < 4; quarter++) {
+
+            // Pull item extents into typed arrays once, so each slice
+            // filter is a tight scan instead of re-reading nested
+            // properties four times per item
+            const packed = plan.packed;
+            const n = packed.length;
+            const starts = new Float32Array(n);
+            const ends = new Float32Array(n);
+            const cols = plan.packed_columns;
+            if (cols) {
+                // Columnar payload from the server - no object walking
+                for (let i = 0; i < n; i++) {
+                    const half = cols.lengths[i] / 2;
+                    starts[i] = cols.xs[i] - half;
+                    ends[i] = cols.xs[i] + half;
+                }
+            } else {
+                for (let i = 0; i < n; i++) {
+                    const half = packed[i].length / 2;
+                    starts[i] = packed[i].position.x - half;
+                    ends[i] = packed[i].position.x + half;
+                }
+            }
+
+            // Screen-space boxes are slice-independent (every canvas is
+            // 800x600), so project them once per plan instead of once per
+            // drawSlice call
+            const padding = 50;
+            const scaleW = (800 - 2 * padding) / maxWidth;
+            const scaleH = (600 - 2 * padding) / maxHeight;
+            const drawHeight = 600 - 2 * padding;
+            const geom = {
+                sx: new Float32Array(n), sy: new Float32Array(n),
+                sw: new Float32Array(n), sh: new Float32Array(n)
+            };
+            if (cols) {
+                for (let i = 0; i < n; i++) {
+                    geom.sx[i] = padding + (cols.ys[i] - cols.widths[i]/2) * scaleW;
+                    geom.sy[i] = padding + drawHeight - ((cols.zs[i] + cols.heights[i]/2) * scaleH);
+                    geom.sw[i] = cols.widths[i] * scaleW;
+                    geom.sh[i] = cols.heights[i] * scaleH;
+                }
+            } else {
+                for (let i = 0; i < n; i++) {
+                    const item = packed[i];
+                    geom.sx[i] = padding + (item.position.y - item.width/2) * scaleW;
+                    geom.sy[i] = padding + drawHeight - ((item.position.z + item.height/2) * scaleH);
+                    geom.sw[i] = item.width * scaleW;
+                    geom.sh[i] = item.height * scaleH;
+                }
+            }
+
+            // Refresh the shared background bitmap if the bay changed
+            const bgKey = maxWidth + '_' + maxHeight;
+            if (typeof OffscreenCanvas !== 'undefined' && bgKey !== gridKey) {
+                const off = new OffscreenCanvas(800, 600);
+                drawSliceBackground(off.getContext('2d', { alpha: false }), 800, 600, maxWidth, maxHeight);
+                gridBitmap = off.transferToImageBitmap();
+                gridKey = bgKey;
+            }
+
+            // Filtering is cheap and happens eagerly; the actual canvas
+            // draw is deferred until a card scrolls into view
+            const pendingDraws = new Map();
+            if (sliceObserver) sliceObserver.disconnect();
+            sliceObserver = typeof IntersectionObserver !== 'undefined'
+                ? new IntersectionObserver((entries) => {
+                    for (const entry of entries) {
+                        if (!entry.isIntersecting) continue;
+                        const draw = pendingDraws.get(entry.target);
+                        if (draw) {
+                            pendingDraws.delete(entry.target);
+                            draw();
+                        }
+                        sliceObserver.unobserve(entry.target);
+                    }
+                }, { rootMargin: '200px' })
+                : null;
+
+            // Render one slice per idle slot so a large plan doesn't
+            // stall scrolling for the whole four-canvas draw
+            const renderOne = (quarter) => {
                 const sliceStart = quarter * quarterWidth;
                 const sliceEnd = (quarter + 1) * quarterWidth;
-                
-                // Filter items in this slice
-                const itemsInSlice = plan.packed.filter(item => {
-                    const itemX = item.position.x;
-                    const itemLength = item.length;
-                    const itemStart = itemX - itemLength/2;
-                    const itemEnd = itemX + itemLength/2;
-                    return itemStart < sliceEnd && itemEnd > sliceStart;
-                });
+
+                // Filter items in this slice, keeping plan indices so
+                // the draw can look up the precomputed geometry
+                const itemsInSlice = [];
+                const idxInSlice = [];
+                for (let i = 0; i < n; i++) {
+                    if (starts[i] < sliceEnd && ends[i] > sliceStart) {
+                        itemsInSlice.push(packed[i]);
+                        idxInSlice.push(i);
+                    }
+                }
                 
                 // Create slice container
                 const sliceDiv = document.createElement('div');
                 sliceDiv.className = 'bg-white border-2 border-gray-300 rounded-lg p-4';
+                // Let the browser skip layout/paint for offscreen cards
+                sliceDiv.style.contentVisibility = 'auto';
+                sliceDiv.style.containIntrinsicSize = '650px';
                 
                 const title = document.createElement('h3');
                 title.className = 'font-bold text-lg mb-3';
@@ -1632,23 +2276,141 @@ HTML_TEMPLATE = '''
                 canvas.className = 'w-full border border-gray-200 rounded';
                 sliceDiv.appendChild(canvas);
                 
-                // Draw the slice
-                drawSlice(canvas, itemsInSlice, maxWidth, maxHeight, plan.stats);
-                
+                // Draw the slice - off the main thread when supported,
+                // and only once the card is (nearly) in the viewport
+                const draw = () => {
+                    const workers = getSliceWorkers();
+                    if (workers.length) {
+                        const off = canvas.transferControlToOffscreen();
+                        workers[quarter].postMessage(
+                            { canvas: off, items: itemsInSlice, maxWidth: maxWidth,
+                              maxHeight: maxHeight, stats: plan.stats, colors: ITEM_COLORS,
+                              background: gridBitmap, geom: geom, indices: idxInSlice },
+                            [off]);
+                    } else {
+                        drawSlice(canvas, itemsInSlice, maxWidth, maxHeight, plan.stats,
+                                  ITEM_COLORS, gridBitmap, geom, idxInSlice);
+                    }
+                };
+
                 container.appendChild(sliceDiv);
+                if (sliceObserver) {
+                    pendingDraws.set(sliceDiv, draw);
+                    sliceObserver.observe(sliceDiv);
+                } else {
+                    draw();
+                }
+            };
+
+            const schedule = window.requestIdleCallback
+                ? (fn) => window.requestIdleCallback(fn)
+                : (fn) => window.requestAnimationFrame(() => fn(null));
+            let q = 0;
+            const step = (deadline) => {
+                while (q < 4 && (!deadline || deadline.timeRemaining() > 4)) {
+                    renderOne(q++);
+                }
+                if (q < 4) schedule(step);
+            };
+            schedule(step);
+        }
+
+        // Item type to color mapping, built once at load instead of per
+        // draw call. Maps clone cleanly through postMessage, so the same
+        // table serves the worker path too.
+        const ITEM_COLORS = new Map([
+            ['Water Case (24 bottles)', 'rgb(51, 128, 230)'],              // Blue
+            ['Dozen NP Food Cans', 'rgb(204, 77, 26)'],                    // Orange/Brown
+            ['First-Aid Kit', 'rgb(230, 26, 26)'],                         // Red
+            ['Toilet Paper (12-Roll Pack)', 'rgb(242, 242, 242)'],         // White
+            ['Sanitary Pads (20 Pack)', 'rgb(230, 128, 204)'],             // Pink
+            ['Clothing Pack (Jacket + Undergarments)', 'rgb(77, 77, 153)'], // Dark Blue
+            ['Blanket (Rolled)', 'rgb(153, 102, 51)'],                     // Brown
+            ['Pet Supplies Pack', 'rgb(230, 179, 51)'],                    // Yellow
+            ['Baby Formula (Case)', 'rgb(204, 230, 179)']                  // Light Green
+        ]);
+        const DEFAULT_ITEM_COLOR = 'rgb(128, 128, 204)'; // Gray-blue
+
+        // Cached slice background bitmap, rebuilt only when the bay
+        // cross-section changes
+        let gridBitmap = null;
+        let gridKey = '';
+
+        // Observer that triggers deferred slice draws; replaced on every
+        // renderPDFSlices call
+        let sliceObserver = null;
+
+        // Worker pool for slice rendering. drawSlice is self-contained, so
+        // its own source plus a small onmessage shim becomes the worker
+        // script via a Blob URL - no separate file to serve. Browsers
+        // without OffscreenCanvas fall back to drawing synchronously.
+        let sliceWorkers = null;
+        function getSliceWorkers() {
+            if (sliceWorkers !== null) return sliceWorkers;
+            if (typeof OffscreenCanvas === 'undefined' || typeof Worker === 'undefined' ||
+                !HTMLCanvasElement.prototype.transferControlToOffscreen) {
+                sliceWorkers = [];
+                return sliceWorkers;
             }
+            const src = 'const DEFAULT_ITEM_COLOR = ' + JSON.stringify(DEFAULT_ITEM_COLOR) + ';\\n' +
+                drawSliceBackground.toString() + '\\n' +
+                drawSlice.toString() + '\\n' +
+                'onmessage = (e) => { const d = e.data; ' +
+                'drawSlice(d.canvas, d.items, d.maxWidth, d.maxHeight, d.stats, d.colors, d.background, d.geom, d.indices); };';
+            const url = URL.createObjectURL(new Blob([src], { type: 'text/javascript' }));
+            sliceWorkers = [0, 1, 2, 3].map(() => new Worker(url));
+            return sliceWorkers;
         }
 
-        function drawSlice(canvas, items, maxWidth, maxHeight, stats) {
-            const ctx = canvas.getContext('2d');
+        // Background fill, bay outline and grid - identical for every
+        // slice of a given bay size, so it can be rendered once to a
+        // bitmap and stamped into each canvas
+        function drawSliceBackground(ctx, width, height, maxWidth, maxHeight) {
+            const padding = 50;
+            const drawWidth = width - 2 * padding;
+            const drawHeight = height - 2 * padding;
+
+            ctx.fillStyle = '#F9FAFB';
+            ctx.fillRect(0, 0, width, height);
+
+            ctx.strokeStyle = '#1F2937';
+            ctx.lineWidth = 3;
+            ctx.strokeRect(padding, padding, drawWidth, drawHeight);
+
+            const scaleW = drawWidth / maxWidth;
+            const scaleH = drawHeight / maxHeight;
+            ctx.strokeStyle = '#D1D5DB';
+            ctx.lineWidth = 1;
+            const grid = new Path2D();
+            for (let i = 0; i <= maxWidth; i += 0.5) {
+                const x = padding + i * scaleW;
+                grid.moveTo(x, padding);
+                grid.lineTo(x, padding + drawHeight);
+            }
+            for (let i = 0; i <= maxHeight; i += 0.5) {
+                const y = padding + i * scaleH;
+                grid.moveTo(padding, y);
+                grid.lineTo(padding + drawWidth, y);
+            }
+            ctx.stroke(grid);
+        }
+
+        function drawSlice(canvas, items, maxWidth, maxHeight, stats, itemColors, background, geom, indices) {
+            // Opaque + desynchronized lets the browser skip alpha
+            // compositing and present the canvas off the main frame loop
+            const ctx = canvas.getContext('2d', { alpha: false, desynchronized: true });
             const padding = 50;
             const drawWidth = canvas.width - 2 * padding;
             const drawHeight = canvas.height - 2 * padding;
-            
-            // Clear canvas
-            ctx.fillStyle = '#F9FAFB';
-            ctx.fillRect(0, 0, canvas.width, canvas.height);
-            
+
+            // Stamp the cached background, or draw it directly when no
+            // bitmap could be prepared
+            if (background) {
+                ctx.drawImage(background, 0, 0);
+            } else {
+                drawSliceBackground(ctx, canvas.width, canvas.height, maxWidth, maxHeight);
+            }
+
             // Draw title info
             ctx.fillStyle = '#5B6466';
             ctx.font = 'bold 16px Arial';
@@ -1662,73 +2424,63 @@ HTML_TEMPLATE = '''
             const scaleW = drawWidth / maxWidth;
             const scaleH = drawHeight / maxHeight;
             
-            // Draw cargo bay outline
-            ctx.strokeStyle = '#1F2937';
-            ctx.lineWidth = 3;
-            ctx.strokeRect(padding, padding, drawWidth, drawHeight);
-            
-            // Draw grid
-            ctx.strokeStyle = '#D1D5DB';
-            ctx.lineWidth = 1;
-            for (let i = 0; i <= maxWidth; i += 0.5) {
-                const x = padding + i * scaleW;
-                ctx.beginPath();
-                ctx.moveTo(x, padding);
-                ctx.lineTo(x, padding + drawHeight);
-                ctx.stroke();
+            // Compute box geometry once, then group the draw calls so
+            // each ctx state (fill color, stroke, font) is set once per
+            // group instead of several times per item
+            const count = items.length;
+            const bx = new Float32Array(count);
+            const by = new Float32Array(count);
+            const bw = new Float32Array(count);
+            const bh = new Float32Array(count);
+            const outlines = new Path2D();
+            const byColor = new Map();
+            for (let i = 0; i < count; i++) {
+                const item = items[i];
+                if (geom) {
+                    const gi = indices[i];
+                    bx[i] = geom.sx[gi];
+                    by[i] = geom.sy[gi];
+                    bw[i] = geom.sw[gi];
+                    bh[i] = geom.sh[gi];
+                } else {
+                    bx[i] = padding + (item.position.y - item.width/2) * scaleW;
+                    // Flip Z axis - subtract from max to invert
+                    by[i] = padding + drawHeight - ((item.position.z + item.height/2) * scaleH);
+                    bw[i] = item.width * scaleW;
+                    bh[i] = item.height * scaleH;
+                }
+                outlines.rect(bx[i], by[i], bw[i], bh[i]);
+
+                const color = itemColors.get(item.item_type) || DEFAULT_ITEM_COLOR;
+                let bucket = byColor.get(color);
+                if (!bucket) byColor.set(color, bucket = []);
+                bucket.push(i);
             }
-            for (let i = 0; i <= maxHeight; i += 0.5) {
-                const y = padding + i * scaleH;
-                ctx.beginPath();
-                ctx.moveTo(padding, y);
-                ctx.lineTo(padding + drawWidth, y);
-                ctx.stroke();
+
+            // Fills, one color at a time
+            for (const [color, idxs] of byColor) {
+                ctx.fillStyle = color;
+                for (const i of idxs) ctx.fillRect(bx[i], by[i], bw[i], bh[i]);
             }
-            
-            // Item type to color mapping
-            const itemColors = {
-                'Water Case (24 bottles)': 'rgb(51, 128, 230)',      // Blue
-                'Dozen NP Food Cans': 'rgb(204, 77, 26)',            // Orange/Brown
-                'First-Aid Kit': 'rgb(230, 26, 26)',                 // Red
-                'Toilet Paper (12-Roll Pack)': 'rgb(242, 242, 242)', // White
-                'Sanitary Pads (20 Pack)': 'rgb(230, 128, 204)',     // Pink
-                'Clothing Pack (Jacket + Undergarments)': 'rgb(77, 77, 153)', // Dark Blue
-                'Blanket (Rolled)': 'rgb(153, 102, 51)',             // Brown
-                'Pet Supplies Pack': 'rgb(230, 179, 51)',            // Yellow
-                'Baby Formula (Case)': 'rgb(204, 230, 179)'          // Light Green
-            };
-            
-            items.forEach((item, idx) => {
-                const posY = item.position.y;
-                const posZ = item.position.z;
-                const itemWidth = item.width;
-                const itemHeight = item.height;
-                
-                const x = padding + (posY - itemWidth/2) * scaleW;
-                // Flip Z axis - subtract from max to invert
-                const y = padding + drawHeight - ((posZ + itemHeight/2) * scaleH);
-                const w = itemWidth * scaleW;
-                const h = itemHeight * scaleH;
-                
-                // Draw box with item type color
-                ctx.fillStyle = itemColors[item.item_type] || 'rgb(128, 128, 204)'; // Default to gray-blue
-                ctx.fillRect(x, y, w, h);
-                
-                ctx.strokeStyle = '#000';
-                ctx.lineWidth = 2;
-                ctx.strokeRect(x, y, w, h);
-                
-                // Draw label
-                ctx.fillStyle = '#FFF';
-                ctx.font = 'bold 12px Arial';
-                ctx.textAlign = 'center';
-                ctx.textBaseline = 'middle';
-                ctx.fillText(`ID${item.id}`, x + w/2, y + h/2 - 8);
-                
-                ctx.font = '10px Arial';
-                ctx.fillText(`${item.weight}kg`, x + w/2, y + h/2 + 6);
-            });
-            
+
+            // All outlines in one stroke
+            ctx.strokeStyle = '#000';
+            ctx.lineWidth = 2;
+            ctx.stroke(outlines);
+
+            // Labels on top, one font pass each
+            ctx.fillStyle = '#FFF';
+            ctx.textAlign = 'center';
+            ctx.textBaseline = 'middle';
+            ctx.font = 'bold 12px Arial';
+            for (let i = 0; i < count; i++) {
+                ctx.fillText(`ID${items[i].id}`, bx[i] + bw[i]/2, by[i] + bh[i]/2 - 8);
+            }
+            ctx.font = '10px Arial';
+            for (let i = 0; i < count; i++) {
+                ctx.fillText(`${items[i].weight}kg`, bx[i] + bw[i]/2, by[i] + bh[i]/2 + 6);
+            }
+
             ctx.textAlign = 'left';
         }
 
@@ -1736,40 +2488,14 @@ HTML_TEMPLATE = '''
             loadLoadingCrewPlan();
         }
 
-        async function downloadLoadingCrewPDF() {
-            if (!lastOptimizationResult || !lastAircraftConfig) {
-                alert('No load plan available to download');
-                return;
-            }
-            
-            const response = await fetch('/api/export-pdf', {
-                method: 'POST',
-                headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({
-                    packed: lastOptimizationResult.packed,
-                    max_length: lastAircraftConfig.max_length,
-                    max_width: lastAircraftConfig.max_width,
-                    max_height: lastAircraftConfig.max_height,
-                    stats: lastOptimizationResult.stats
-                })
-            });
-            
-            const blob = await response.blob();
-            const url = window.URL.createObjectURL(blob);
-            const a = document.createElement('a');
-            a.href = url;
-            a.download = 'loading_plan.pdf';
-            document.body.appendChild(a);
-            a.click();
-            window.URL.revokeObjectURL(url);
-            document.body.removeChild(a);
-        }
-
         init();
     </script>
 </body>
 </html>
 '''
 
+# Computed once at import - the template never changes at runtime
+_INDEX_ETAG = hashlib.md5(HTML_TEMPLATE.encode()).hexdigest()
+
 if __name__ == '__main__':
     app.run(debug=True, port=5000)
\ No newline at end of file